@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Ahead-of-time compile the projection kernel into the nba_kernels extension.
+
+    python build_ext.py
+
+nba_total_calc imports nba_kernels when it is present, so short CLI sessions
+skip the Numba JIT warmup entirely. Rebuild after changing _python_kernel.
+"""
+import os
+
+from numba.pycc import CC
+
+from nba_total_calc import _python_kernel
+
+cc = CC("nba_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export(
+    "projection_kernel",
+    # quarter, tleft, total_pts, live, pregame, alpha,
+    # bonus, ftparade, bonus_boost, ot_on, otp, otpts
+    "UniTuple(f8, 7)(i4, f8, f8, f8, f8, f8, b1, b1, f8, b1, f8, f8)",
+)(_python_kernel)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,21 +1,48 @@
 
 #!/usr/bin/env python3
 from __future__ import annotations
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from dataclasses import dataclass, fields
+from enum import IntFlag
+from operator import attrgetter
+import atexit
 import csv
+import functools
+import io
 import math
 import os
+import re
+import sys
+import time
+
+# batch helpers only, imported on first use by _need_batch_deps() so the
+# interactive CLI starts on the stdlib alone
+np = None
+pd = None
 
 # ---------- helpers ----------
+# spaces around either part, a leading + and leading zeros are fine, as int() allowed
+_MMSS_RE = re.compile(r"^\s*\+?(\d+)\s*:\s*\+?(\d+)\s*$")
+
 def parse_mmss(s: str) -> float:
     """Return minutes as float from 'mm:ss'."""
-    parts = s.strip().split(":")
-    if len(parts) != 2:
+    m = _MMSS_RE.match(s.strip())
+    if m is None:
         raise ValueError("Time must be mm:ss (e.g., 7:10).")
-    mm = int(parts[0])
-    ss = int(parts[1])
-    if mm < 0 or ss < 0 or ss >= 60:
+    mm = int(m.group(1))
+    ss = int(m.group(2))
+    if ss >= 60:
+        raise ValueError("Invalid mm:ss.")
+    return mm + ss / 60.0
+
+def parse_mmss_arr(values):
+    """Vector parse_mmss: a column of 'mm:ss' strings -> float minutes ndarray."""
+    _need_batch_deps()
+    parts = pd.Series(values, dtype=str).str.strip().str.extract(_MMSS_RE)
+    if parts.isna().any(axis=None):
+        raise ValueError("Time must be mm:ss (e.g., 7:10).")
+    mm = parts[0].to_numpy(dtype=np.int16)
+    ss = parts[1].to_numpy(dtype=np.int16)
+    if np.any(ss >= 60):
         raise ValueError("Invalid mm:ss.")
     return mm + ss / 60.0
 
@@ -24,22 +51,44 @@ def clamp(x: float, lo: float, hi: float) -> float:
 
 def auto_alpha(elapsed_min: float) -> float:
     # cautious early, trusts live more later
-    return clamp(0.35 + 0.012 * elapsed_min, 0.35, 0.90)
+    v = 0.35 + 0.012 * elapsed_min
+    return 0.35 if v < 0.35 else 0.90 if v > 0.90 else v
+
+# decimal odds for every integer line bettors actually see
+_DEC_CACHE = {
+    a: (1.0 + 100.0 / abs(a) if a < 0 else 1.0 + a / 100.0)
+    for a in range(-400, 401)
+    if a != 0
+}
 
 def dec_from_american(a: float) -> float:
+    r = _DEC_CACHE.get(a)
+    if r is not None:
+        return r
     if a == 0:
         raise ValueError("American odds cannot be 0.")
     if a < 0:
         return 1.0 + (100.0 / abs(a))
     return 1.0 + (a / 100.0)
 
+def dec_from_american_vec(a):
+    """Array version of dec_from_american."""
+    _need_batch_deps()
+    a = np.asarray(a, dtype=float)
+    if np.any(a == 0):
+        raise ValueError("American odds cannot be 0.")
+    return np.where(a < 0, 1.0 + 100.0 / np.abs(a), 1.0 + a / 100.0)
+
+def _now() -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+
 def fmt(x: float, d: int = 1) -> str:
     if x is None or (isinstance(x, float) and (math.isnan(x) or math.isinf(x))):
         return "—"
     return f"{x:.{d}f}"
 
 # ---------- core ----------
-@dataclass
+@dataclass(slots=True)
 class CalcResult:
     timestamp: str
     quarter: int
@@ -56,72 +105,80 @@ class CalcResult:
     needed_ppm_for_live: float
     lean: str
     flags: str  # semicolon-separated
-
-def compute_projection(
+    flag_mask: int  # Flag bits for the same flags
+
+class Flag(IntFlag):
+    EARLY_BONUS_HIGH_RISK = 1
+    BONUS_ON = 2
+    FT_PARADE = 4
+    HIGH_FT_RATE = 8
+    ELEVATED_FT_RATE = 16
+    THREE_P = 32
+    OT_ON = 64
+
+# flag label (text before any "(...)") -> bit, for rebuilding masks from saved text
+_FLAG_LABELS = {
+    "EARLY_BONUS_HIGH_RISK": Flag.EARLY_BONUS_HIGH_RISK,
+    "BONUS/WHISTLES_ON": Flag.BONUS_ON,
+    "FT_PARADE": Flag.FT_PARADE,
+    "HIGH_FT_RATE": Flag.HIGH_FT_RATE,
+    "ELEVATED_FT_RATE": Flag.ELEVATED_FT_RATE,
+    "3P_HOT": Flag.THREE_P,
+    "3P_COLD": Flag.THREE_P,
+    "3P_NORMAL": Flag.THREE_P,
+    "OT_ON": Flag.OT_ON,
+}
+
+def _mask_from_flags(flags: str) -> int:
+    """CalcResult.flags text -> the matching flag_mask."""
+    mask = 0
+    for f in flags.split(";"):
+        mask |= _FLAG_LABELS.get(f.split("(", 1)[0], 0)
+    return int(mask)
+
+# hedge risk buckets; an early bonus counts as both
+_BAD_FLAGS = int(Flag.EARLY_BONUS_HIGH_RISK | Flag.FT_PARADE | Flag.HIGH_FT_RATE)
+_WARN_FLAGS = int(
+    Flag.EARLY_BONUS_HIGH_RISK | Flag.BONUS_ON | Flag.ELEVATED_FT_RATE | Flag.THREE_P | Flag.OT_ON
+)
+
+def _build_flags(
     quarter: int,
-    time_left_mmss: str,
-    total_points: float,
-    live_total: float,
-    pregame_total: float,
-    alpha: float | None = None,
-    edge_threshold: float = 4.0,
-    bonus: bool = False,
-    ft_parade: bool = False,
-    bonus_boost_ppm: float = 0.25,
-    fta_total: float | None = None,
-    three_pt_pct: float | None = None,
-    ot_on: bool = False,
-    ot_prob_pct: float = 6.0,
-    ot_expected_points: float = 10.0,
-) -> CalcResult:
-    # elapsed minutes
-    tleft = parse_mmss(time_left_mmss)
-    elapsed = (quarter - 1) * 12.0 + (12.0 - tleft)
-    if elapsed <= 0 or elapsed > 48:
-        raise ValueError("Elapsed time out of bounds. Check quarter/time left.")
-
-    alpha_used = auto_alpha(elapsed) if alpha is None else clamp(alpha, 0.05, 0.95)
-
-    pace_ppm = total_points / elapsed
-    pace_proj = pace_ppm * 48.0
-
-    baseline_rate = pregame_total / 48.0
-
-    boost = 0.0
-    if bonus:
-        boost += bonus_boost_ppm
-    if ft_parade:
-        boost += 0.35
-
-    blended_rate = alpha_used * (pace_ppm + boost) + (1 - alpha_used) * baseline_rate
-    blended_proj = total_points + blended_rate * (48.0 - elapsed)
-
-    if ot_on:
-        ot_adj = (ot_prob_pct / 100.0) * ot_expected_points
-        blended_proj += ot_adj
-
-    needed_ppm = (live_total - total_points) / (48.0 - elapsed)
-    edge = blended_proj - live_total
-
-    # flags
+    tleft: float,
+    elapsed: float,
+    bonus: bool,
+    ft_parade: bool,
+    fta_total: float | None,
+    three_pt_pct: float | None,
+    ot_on: bool,
+    ot_prob_pct: float,
+    ot_expected_points: float,
+) -> tuple[list[str], int]:
     flags = []
+    mask = 0
     if bonus and quarter <= 3 and tleft > 6:
         flags.append("EARLY_BONUS_HIGH_RISK")
+        mask |= Flag.EARLY_BONUS_HIGH_RISK
     elif bonus:
         flags.append("BONUS/WHISTLES_ON")
+        mask |= Flag.BONUS_ON
     if ft_parade:
         flags.append("FT_PARADE")
+        mask |= Flag.FT_PARADE
 
     if fta_total is not None:
         fta_per_min = fta_total / elapsed
         if fta_per_min >= 1.10:
             flags.append(f"HIGH_FT_RATE({fta_per_min:.2f}/min)")
+            mask |= Flag.HIGH_FT_RATE
         elif fta_per_min >= 0.85:
             flags.append(f"ELEVATED_FT_RATE({fta_per_min:.2f}/min)")
+            mask |= Flag.ELEVATED_FT_RATE
         else:
             flags.append(f"FT_RATE_OK({fta_per_min:.2f}/min)")
 
     if three_pt_pct is not None:
+        mask |= Flag.THREE_P
         if three_pt_pct >= 0.42:
             flags.append(f"3P_HOT({three_pt_pct*100:.1f}%)")
         elif three_pt_pct <= 0.31:
@@ -131,15 +188,131 @@ def compute_projection(
 
     if ot_on:
         flags.append(f"OT_ON({ot_prob_pct:.1f}% -> +{(ot_prob_pct/100)*ot_expected_points:.1f} pts)")
+        mask |= Flag.OT_ON
+
+    return flags, int(mask)
+
+def _python_kernel(
+    quarter, tleft, total_pts, live, pregame, alpha,
+    bonus, ftparade, bonus_boost, ot_on, otp, otpts,
+):
+    """Numeric core of compute_projection. alpha < 0 means auto (NaN checks
+    are not reliable under fastmath)."""
+    # elapsed minutes
+    elapsed = (quarter - 1) * 12.0 + (12.0 - tleft)
+    if elapsed <= 0 or elapsed > 48:
+        raise ValueError("Elapsed time out of bounds. Check quarter/time left.")
+
+    if alpha < 0:
+        v = 0.35 + 0.012 * elapsed
+        alpha_used = 0.35 if v < 0.35 else 0.90 if v > 0.90 else v
+    else:
+        alpha_used = 0.05 if alpha < 0.05 else 0.95 if alpha > 0.95 else alpha
+
+    inv_elapsed = 1.0 / elapsed
+    remain = 48.0 - elapsed
+    pace_ppm = total_pts * inv_elapsed
+    pace_proj = pace_ppm * 48.0
+
+    baseline_rate = pregame / 48.0
+
+    boost = 0.0
+    if bonus:
+        boost += bonus_boost
+    if ftparade:
+        boost += 0.35
+
+    blended_rate = baseline_rate + alpha_used * ((pace_ppm + boost) - baseline_rate)
+    blended_proj = total_pts + blended_rate * remain
+
+    if ot_on:
+        ot_adj = (otp / 100.0) * otpts
+        blended_proj += ot_adj
+
+    needed_ppm = (live - total_pts) / remain
+    edge = blended_proj - live
+    return elapsed, alpha_used, pace_ppm, pace_proj, blended_proj, edge, needed_ppm
+
+try:  # AOT build from build_ext.py: native from the first call, no numba import
+    from nba_kernels import projection_kernel as _projection_kernel
+    _HAVE_AOT = True
+except ImportError:
+    _HAVE_AOT = False
+    # JIT cache survives across runs, so only the first session pays compile time
+    os.environ.setdefault(
+        "NUMBA_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "nba_total_calc")
+    )
+    try:
+        from numba import njit
+    except ImportError:
+        def njit(*args, **kwargs):
+            # no numba: run the kernels as plain Python
+            if len(args) == 1 and callable(args[0]) and not kwargs:
+                return args[0]
+            return lambda f: f
+
+    _inline_kernel = njit(inline="always", fastmath=True)(_python_kernel)
+
+@functools.lru_cache(maxsize=None)
+def _kernel_for(bonus: bool, ft_parade: bool, ot_on: bool):
+    """Projection kernel with the per-session toggles baked in as constants,
+    so the JIT drops the branches they switch off."""
+    if _HAVE_AOT:
+        # already native; constant folding needs the JIT
+        def k(quarter, tleft, total_pts, live, pregame, alpha, bonus_boost, otp, otpts):
+            return _projection_kernel(
+                quarter, tleft, total_pts, live, pregame, alpha,
+                bonus, ft_parade, bonus_boost, ot_on, otp, otpts,
+            )
+        return k
 
-    # lean
-    lean = "PASS / WAIT"
-    if edge >= edge_threshold:
-        lean = "LEAN: OVER"
-    elif edge <= -edge_threshold:
-        lean = "LEAN: UNDER"
+    def k(quarter, tleft, total_pts, live, pregame, alpha, bonus_boost, otp, otpts):
+        return _inline_kernel(
+            quarter, tleft, total_pts, live, pregame, alpha,
+            bonus, ft_parade, bonus_boost, ot_on, otp, otpts,
+        )
+    return njit(cache=True, fastmath=True)(k)
 
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+# lean by 2*(edge >= thr) + (edge <= -thr); the last slot only hits with thr < 0
+_LEANS = ("PASS / WAIT", "LEAN: UNDER", "LEAN: OVER", "LEAN: OVER")
+
+def compute_projection(
+    quarter: int,
+    time_left_mmss: str,
+    total_points: float,
+    live_total: float,
+    pregame_total: float,
+    alpha: float | None = None,
+    edge_threshold: float = 4.0,
+    bonus: bool = False,
+    ft_parade: bool = False,
+    bonus_boost_ppm: float = 0.25,
+    fta_total: float | None = None,
+    three_pt_pct: float | None = None,
+    ot_on: bool = False,
+    ot_prob_pct: float = 6.0,
+    ot_expected_points: float = 10.0,
+    timestamp: str | None = None,
+) -> CalcResult:
+    if alpha is not None and not math.isfinite(alpha):
+        raise ValueError("Alpha must be a finite number (blank = auto).")
+    tleft = parse_mmss(time_left_mmss)
+    (
+        elapsed, alpha_used, pace_ppm, pace_proj, blended_proj, edge, needed_ppm,
+    ) = _kernel_for(bool(bonus), bool(ft_parade), bool(ot_on))(
+        quarter, tleft, total_points, live_total, pregame_total,
+        -1.0 if alpha is None else max(alpha, 0.0),
+        bonus_boost_ppm, ot_prob_pct, ot_expected_points,
+    )
+
+    flags, flag_mask = _build_flags(
+        quarter, tleft, elapsed, bonus, ft_parade,
+        fta_total, three_pt_pct, ot_on, ot_prob_pct, ot_expected_points,
+    )
+
+    lean = _LEANS[2 * (edge >= edge_threshold) + (edge <= -edge_threshold)]
+
+    ts = timestamp if timestamp is not None else _now()
 
     return CalcResult(
         timestamp=ts,
@@ -157,10 +330,262 @@ def compute_projection(
         needed_ppm_for_live=needed_ppm,
         lean=lean,
         flags=";".join(flags) if flags else "NONE",
+        flag_mask=flag_mask,
     )
 
+# ---------- batch ----------
+def _need_batch_deps() -> None:
+    global np, pd
+    if np is not None and pd is not None:
+        return
+    try:
+        import numpy
+        import pandas
+    except ImportError:
+        raise ImportError("Batch mode needs numpy and pandas (pip install numpy pandas).") from None
+    np, pd = numpy, pandas
+
+_TRUTHY = ("y", "yes", "true", "1", "1.0")
+
+def _as_bool(values):
+    """Toggle column -> bool ndarray. Numbers count when non-zero, text when it
+    reads like y/yes/true/1; blanks and NaN are off."""
+    a = np.asarray(values)
+    if a.dtype.kind == "b":
+        return a
+    if a.dtype.kind in "iuf":
+        return np.nan_to_num(a.astype(float)) != 0
+    return pd.Series(a.ravel(), dtype=object).map(
+        lambda v: str(v).strip().lower() in _TRUTHY if isinstance(v, str)
+        else bool(v) and v == v
+    ).to_numpy(dtype=bool).reshape(a.shape)
+
+def _column(data, name: str, n: int, default, dtype=float):
+    """Column `name` of a DataFrame/dict as a length-n array, or `default` broadcast."""
+    if name in data:
+        values = _as_bool(data[name]) if dtype is bool else np.asarray(data[name], dtype=dtype)
+        return np.broadcast_to(values, (n,))
+    return np.full(n, default, dtype=dtype)
+
+def _scatter_text(on, text):
+    """Str column the length of `on`: `text` (one entry per True) there, '' elsewhere."""
+    col = np.full(len(on), "", dtype=text.dtype if text.size else "U1")
+    col[on] = text
+    return col
+
+# column dtypes for batch results, in CalcResult field order; str columns take
+# their width from the data so nothing is cut off
+_CALC_DTYPES = {
+    "timestamp": str,
+    "quarter": "i4",
+    "time_left": str,
+    "total_points": "f8",
+    "live_total": "f8",
+    "pregame_total": "f8",
+    "elapsed_min": "f8",
+    "alpha_used": "f8",
+    "pace_ppm": "f8",
+    "pace_proj": "f8",
+    "blended_proj": "f8",
+    "edge_vs_live": "f8",
+    "needed_ppm_for_live": "f8",
+    "lean": "U11",  # longest _LEANS entry
+    "flags": str,
+    "flag_mask": "i4",
+}
+
+def compute_projection_vec(
+    data,
+    edge_threshold: float = 4.0,
+    bonus_boost_ppm: float = 0.25,
+    timestamp: str | None = None,
+):
+    """Score many snapshots at once.
+
+    `data` is a DataFrame or dict of equal-length columns named like the
+    compute_projection args: quarter, time_left ('mm:ss'), total_points,
+    live_total, pregame_total, and optionally alpha, bonus, ft_parade,
+    fta_total, three_pt_pct, ot_on, ot_prob_pct, ot_expected_points.
+    NaN alpha/fta_total/three_pt_pct mean auto / not given. All rows share
+    one timestamp (default: now).
+    Returns a dict of arrays keyed like CalcResult (see _CALC_DTYPES);
+    to_dataclasses() turns it back into CalcResult rows.
+    """
+    _need_batch_deps()
+    quarter = np.asarray(data["quarter"], dtype=np.int64)
+    n = len(quarter)
+    time_left = np.asarray(data["time_left"], dtype=str)
+    tleft = parse_mmss_arr(time_left)
+
+    total_points = np.asarray(data["total_points"], dtype=float)
+    live_total = np.asarray(data["live_total"], dtype=float)
+    pregame_total = np.asarray(data["pregame_total"], dtype=float)
+    alpha = _column(data, "alpha", n, np.nan)
+    bonus = _column(data, "bonus", n, False, bool)
+    ft_parade = _column(data, "ft_parade", n, False, bool)
+    fta_total = _column(data, "fta_total", n, np.nan)
+    three_pt_pct = _column(data, "three_pt_pct", n, np.nan)
+    ot_on = _column(data, "ot_on", n, False, bool)
+    ot_prob_pct = _column(data, "ot_prob_pct", n, 6.0)
+    ot_expected_points = _column(data, "ot_expected_points", n, 10.0)
+
+    ts = timestamp if timestamp is not None else _now()
+
+    # columnar result, allocated once and filled in place
+    out = {
+        name: None if dt is str else np.empty(n, dtype=dt)
+        for name, dt in _CALC_DTYPES.items()
+    }
+    out["timestamp"] = np.full(n, ts, dtype=f"U{max(len(ts), 1)}")
+    out["quarter"][:] = quarter
+    out["time_left"] = time_left
+    out["total_points"][:] = total_points
+    out["live_total"][:] = live_total
+    out["pregame_total"][:] = pregame_total
+
+    elapsed = out["elapsed_min"]
+    elapsed[:] = (quarter - 1) * 12.0 + (12.0 - tleft)
+    if np.any((elapsed <= 0) | (elapsed > 48)):
+        raise ValueError("Elapsed time out of bounds. Check quarter/time left.")
+
+    alpha_used = out["alpha_used"]
+    alpha_used[:] = np.where(
+        np.isnan(alpha),
+        np.clip(0.35 + 0.012 * elapsed, 0.35, 0.90),
+        np.clip(alpha, 0.05, 0.95),
+    )
+
+    inv_elapsed = 1.0 / elapsed
+    remain = 48.0 - elapsed
+    if np.any(remain == 0):
+        # same failure as the scalar path at Q4 0:00
+        raise ZeroDivisionError("No time left to project (Q4 0:00).")
+    pace_ppm = np.multiply(total_points, inv_elapsed, out=out["pace_ppm"])
+    np.multiply(pace_ppm, 48.0, out=out["pace_proj"])
+
+    baseline_rate = pregame_total / 48.0
+    boost = bonus * bonus_boost_ppm + ft_parade * 0.35
+
+    blended_rate = baseline_rate + alpha_used * ((pace_ppm + boost) - baseline_rate)
+    blended_proj = out["blended_proj"]
+    blended_proj[:] = total_points + blended_rate * remain
+    blended_proj += np.where(ot_on, (ot_prob_pct / 100.0) * ot_expected_points, 0.0)
+
+    np.divide(live_total - total_points, remain, out=out["needed_ppm_for_live"])
+    edge = np.subtract(blended_proj, live_total, out=out["edge_vs_live"])
+
+    out["lean"][:] = np.take(_LEANS, 2 * (edge >= edge_threshold) + (edge <= -edge_threshold))
+
+    # flags: one label column per category, then join the non-empty ones
+    early_bonus = bonus & (quarter <= 3) & (tleft > 6)
+    bonus_flag = np.select(
+        [early_bonus, bonus],
+        ["EARLY_BONUS_HIGH_RISK", "BONUS/WHISTLES_ON"],
+        default="",
+    )
+    ft_flag = np.where(ft_parade, "FT_PARADE", "")
+
+    # np.char.mod formats element by element in Python, so each number is
+    # formatted once and only on the rows that carry the flag
+    has_fta = ~np.isnan(fta_total)
+    fta_per_min = fta_total / elapsed
+    rate = fta_per_min[has_fta]
+    fta_label = np.select(
+        [rate >= 1.10, rate >= 0.85],
+        ["HIGH_FT_RATE(", "ELEVATED_FT_RATE("],
+        default="FT_RATE_OK(",
+    )
+    fta_flag = _scatter_text(
+        has_fta, np.char.add(np.char.add(fta_label, np.char.mod("%.2f", rate)), "/min)")
+    )
+
+    has_tp = ~np.isnan(three_pt_pct)
+    tp = three_pt_pct[has_tp]
+    tp_label = np.select([tp >= 0.42, tp <= 0.31], ["3P_HOT(", "3P_COLD("], default="3P_NORMAL(")
+    tp_flag = _scatter_text(
+        has_tp, np.char.add(np.char.add(tp_label, np.char.mod("%.1f", tp * 100)), "%)")
+    )
+
+    otp = ot_prob_pct[ot_on]
+    ot_txt = np.char.add(
+        np.char.add(np.char.add("OT_ON(", np.char.mod("%.1f", otp)), "% -> +"),
+        np.char.add(np.char.mod("%.1f", (otp / 100) * ot_expected_points[ot_on]), " pts)"),
+    )
+    ot_flag = _scatter_text(ot_on, ot_txt)
+
+    flags = bonus_flag
+    for col in (ft_flag, fta_flag, tp_flag, ot_flag):
+        sep = np.where((flags != "") & (col != ""), ";", "")
+        flags = np.char.add(np.char.add(flags, sep), col)
+    out["flags"] = np.where(flags == "", "NONE", flags)
+
+    out["flag_mask"][:] = (
+        early_bonus * Flag.EARLY_BONUS_HIGH_RISK
+        + (bonus & ~early_bonus) * Flag.BONUS_ON
+        + ft_parade * Flag.FT_PARADE
+        + (has_fta & (fta_per_min >= 1.10)) * Flag.HIGH_FT_RATE
+        + (has_fta & (fta_per_min >= 0.85) & (fta_per_min < 1.10)) * Flag.ELEVATED_FT_RATE
+        + has_tp * Flag.THREE_P
+        + ot_on * Flag.OT_ON
+    )
+
+    return out
+
+def to_dataclasses(out) -> list[CalcResult]:
+    """Columnar compute_projection_vec output -> list of CalcResult."""
+    cols = [out[name].tolist() for name in _CALC_DTYPES]
+    return [CalcResult(*row) for row in zip(*cols)]
+
+# column order for headerless piped rows; trailing columns may be omitted
+_PIPE_COLUMNS = (
+    "quarter", "time_left", "total_points", "live_total", "pregame_total",
+    "alpha", "bonus", "ft_parade", "fta_total", "three_pt_pct",
+    "ot_on", "ot_prob_pct", "ot_expected_points",
+)
+_PIPE_BOOLS = ("bonus", "ft_parade", "ot_on")
+
+def parse_lines(lines: list[str]):
+    """CSV lines -> DataFrame for compute_projection_vec.
+
+    A first line starting with 'quarter' is read as a header; otherwise columns
+    follow _PIPE_COLUMNS. Blank cells take the CLI defaults. Toggle cells stay
+    text; compute_projection_vec reads y/yes/true/1 as on.
+    """
+    _need_batch_deps()
+    lines = [ln for ln in lines if ln.strip()]
+    has_header = bool(lines) and lines[0].lstrip().lower().startswith("quarter")
+    df = pd.read_csv(
+        io.StringIO("\n".join(lines)),
+        header=0 if has_header else None,
+        names=None if has_header else list(_PIPE_COLUMNS),
+        dtype={"time_left": str, **{name: str for name in _PIPE_BOOLS}},
+        skipinitialspace=True,
+    )
+    df["pregame_total"] = df["pregame_total"].fillna(228.5) if "pregame_total" in df else 228.5
+    for name, default in (("ot_prob_pct", 6.0), ("ot_expected_points", 10.0)):
+        if name in df:
+            df[name] = df[name].fillna(default)
+    return df
+
+def run_pipe(text: str) -> None:
+    """Non-interactive mode: score every piped row, print a line each, save all."""
+    df = parse_lines(text.splitlines())
+    if df.empty:
+        return
+    out = compute_projection_vec(df)
+    sys.stdout.write("".join(
+        f"Q{q} {tl} | proj {fmt(p,1)} vs live {fmt(lv,1)} | edge {fmt(e,1)} => {ln} | {fl}\n"
+        for q, tl, p, lv, e, ln, fl in zip(
+            out["quarter"].tolist(), out["time_left"].tolist(),
+            out["blended_proj"].tolist(), out["live_total"].tolist(),
+            out["edge_vs_live"].tolist(), out["lean"].tolist(), out["flags"].tolist(),
+        )
+    ))
+    save_snapshots(out)
+    print(f"Saved {len(df)} snapshots -> {CSV_FILE}")
+
 # ---------- hedge ----------
-@dataclass
+@dataclass(slots=True)
 class HedgeResult:
     suggestion: str
     equalized_hedge_stake: float
@@ -168,6 +593,21 @@ class HedgeResult:
     worst_case_profit: float
     best_case_profit: float
 
+def _suggestion_for(clv6: bool, clv3: bool, bad: bool, warn: bool) -> str:
+    if clv6 and (bad or warn):
+        return "Consider SMALL hedge"
+    if clv6:
+        return "Hold (good CLV)"
+    if clv3 and bad:
+        return "Watch closely (whistle risk)"
+    return "No hedge signal"
+
+# indexed by clv>=6, clv>=3, bad>=1, warn>=2 packed high to low bit
+_SUGGESTIONS = tuple(
+    _suggestion_for(bool(i & 8), bool(i & 4), bool(i & 2), bool(i & 1))
+    for i in range(16)
+)
+
 def hedge_equalize(
     my_side: str,           # "UNDER" or "OVER"
     my_line: float,
@@ -176,7 +616,7 @@ def hedge_equalize(
     hedge_line: float,
     hedge_odds_american: float,
     live_total: float,
-    flags: list[str],
+    flag_mask: int,         # CalcResult.flag_mask
 ) -> HedgeResult:
     my_side = my_side.upper().strip()
     if my_side not in ("UNDER", "OVER"):
@@ -190,17 +630,12 @@ def hedge_equalize(
 
     # CLV heuristic
     clv = (my_line - live_total) if my_side == "UNDER" else (live_total - my_line)
-    bad = sum("HIGH_RISK" in f or "FT_PARADE" in f or "HIGH_FT_RATE" in f for f in flags)
-    warn = sum(("BONUS" in f or "ELEVATED_FT_RATE" in f or "3P_" in f or "OT_ON" in f) for f in flags)
-
-    if clv >= 6 and (bad >= 1 or warn >= 2):
-        suggestion = "Consider SMALL hedge"
-    elif clv >= 6:
-        suggestion = "Hold (good CLV)"
-    elif clv >= 3 and bad >= 1:
-        suggestion = "Watch closely (whistle risk)"
-    else:
-        suggestion = "No hedge signal"
+    bad = (flag_mask & _BAD_FLAGS).bit_count()
+    warn = (flag_mask & _WARN_FLAGS).bit_count()
+
+    suggestion = _SUGGESTIONS[
+        (clv >= 6) << 3 | (clv >= 3) << 2 | (bad >= 1) << 1 | (warn >= 2)
+    ]
 
     # middle detection
     if my_side == "UNDER":
@@ -233,13 +668,130 @@ def hedge_equalize(
 # ---------- CSV snapshots ----------
 CSV_FILE = "nba_total_snapshots.csv"
 
-def save_snapshot(result: CalcResult) -> None:
-    new_file = not os.path.exists(CSV_FILE)
-    with open(CSV_FILE, "a", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=list(asdict(result).keys()))
+_CALC_FIELDS = tuple(f.name for f in fields(CalcResult))
+_calc_row = attrgetter(*_CALC_FIELDS)  # CalcResult -> tuple in CSV column order
+# layout written before flag_mask existed; such files are upgraded in place
+_LEGACY_FIELDS = tuple(n for n in _CALC_FIELDS if n != "flag_mask")
+
+def _read_header(path: str) -> list[str] | None:
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), None)
+
+def _migrate_legacy_csv(path: str) -> None:
+    """Rewrite a pre-flag_mask snapshot file with flag_mask rebuilt from flags."""
+    tmp = path + ".tmp"
+    flags_at = _LEGACY_FIELDS.index("flags")
+    with open(path, newline="", encoding="utf-8") as src, \
+            open(tmp, "w", newline="", encoding="utf-8") as dst:
+        rows = csv.reader(src)
+        next(rows)
+        w = csv.writer(dst)
+        w.writerow(_CALC_FIELDS)
+        w.writerows(row + [_mask_from_flags(row[flags_at])] for row in rows)
+    os.replace(tmp, path)
+
+class _SnapshotWriter:
+    """Append handle on CSV_FILE, opened on first write and kept for the session."""
+
+    def __init__(self) -> None:
+        self._f = None
+        self._w = None
+
+    def _open(self) -> None:
+        header = _read_header(CSV_FILE)
+        if header == list(_LEGACY_FIELDS):
+            _migrate_legacy_csv(CSV_FILE)
+        elif header is not None and header != list(_CALC_FIELDS):
+            raise ValueError(
+                f"{CSV_FILE} has unexpected columns; move it aside to start a new file."
+            )
+        new_file = header is None
+        # big buffer: a batch becomes a few large writes, flushed once at the end
+        self._f = open(CSV_FILE, "a", newline="", encoding="utf-8", buffering=1 << 20)
+        self._w = csv.writer(self._f)
         if new_file:
-            w.writeheader()
-        w.writerow(asdict(result))
+            self._w.writerow(_CALC_FIELDS)
+
+    def write_many(self, results) -> None:
+        if self._f is None:
+            self._open()
+        self._w.writerows(map(_calc_row, results))
+        self._f.flush()
+
+    def write_columns(self, out) -> None:
+        if self._f is None:
+            self._open()
+        # same \r\n row ending csv.writer uses
+        pd.DataFrame(out, columns=_CALC_FIELDS).to_csv(
+            self._f, header=False, index=False, lineterminator="\r\n"
+        )
+        self._f.flush()
+
+    def write(self, result: CalcResult) -> None:
+        self.write_many((result,))
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+            self._w = None
+
+_snapshot_writer = _SnapshotWriter()
+atexit.register(_snapshot_writer.close)
+
+def save_snapshot(result: CalcResult) -> None:
+    _snapshot_writer.write(result)
+
+def save_snapshots(results) -> None:
+    """Append a list of CalcResult, or compute_projection_vec columns."""
+    if isinstance(results, dict):
+        _need_batch_deps()
+        _snapshot_writer.write_columns(results)
+    else:
+        _snapshot_writer.write_many(results)
+
+def load_snapshots() -> dict:
+    """Read CSV_FILE back as typed columns (dict of ndarrays).
+
+    Besides the saved columns, the result carries the compute_projection_vec
+    inputs that can be recovered: alpha (from alpha_used), bonus / ft_parade /
+    ot_on (from flag_mask) and ot_prob_pct / ot_expected_points (from the OT
+    flag text, so to its 0.1 rounding). Re-scoring it, e.g. with a different
+    pregame total, reproduces the saved projection as long as the default
+    bonus_boost_ppm was used. fta_total and three_pt_pct are not saved, so
+    re-scored rows lose their FT-rate and 3P flags.
+    """
+    _need_batch_deps()
+    text_cols = ("timestamp", "time_left", "lean", "flags")
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:  # no pyarrow: pandas' own C parser
+        df = pd.read_csv(CSV_FILE, dtype={name: str for name in text_cols})
+    else:
+        # column_types, not pandas dtype=: pyarrow would still infer timestamps
+        opts = pa_csv.ConvertOptions(column_types={name: pa.string() for name in text_cols})
+        df = pa_csv.read_csv(CSV_FILE, convert_options=opts).to_pandas()
+    snap = {name: df[name].to_numpy() for name in df.columns}
+
+    if "flag_mask" not in snap:  # file from before flag_mask
+        snap["flag_mask"] = np.array(
+            [_mask_from_flags(f) for f in df["flags"].tolist()], dtype=np.int64
+        )
+    mask = snap["flag_mask"]
+    snap["alpha"] = snap["alpha_used"]
+    snap["bonus"] = (mask & (Flag.EARLY_BONUS_HIGH_RISK | Flag.BONUS_ON)) != 0
+    snap["ft_parade"] = (mask & Flag.FT_PARADE) != 0
+    snap["ot_on"] = (mask & Flag.OT_ON) != 0
+    ot = df["flags"].str.extract(r"OT_ON\(([\d.]+)% -> \+([\d.]+) pts\)").astype(float)
+    ot_prob = ot[0].to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ot_points = ot[1].to_numpy() * 100.0 / ot_prob
+    snap["ot_prob_pct"] = np.where(np.isnan(ot_prob), 6.0, ot_prob)
+    snap["ot_expected_points"] = np.where(np.isfinite(ot_points), ot_points, 10.0)
+    return snap
 
 def print_result(r: CalcResult) -> None:
     print("\n=== NBA LIVE TOTAL READ ===")
@@ -254,6 +806,13 @@ def print_result(r: CalcResult) -> None:
 
 # ---------- CLI loop ----------
 def main():
+    if not sys.stdin.isatty():
+        try:
+            run_pipe(sys.stdin.read())
+        except Exception as e:
+            raise SystemExit(f"Error: {e}")
+        return
+
     print("NBA Live Total Calculator (Terminal)")
     print("Type 'q' at any prompt to quit. Snapshots save to nba_total_snapshots.csv\n")
 
@@ -356,7 +915,6 @@ def main():
                 hedge_line = live if s == "" else float(s)
                 hedge_odds = float(input("Hedge odds (American): ").strip())
 
-                flags_list = [] if r.flags == "NONE" else r.flags.split(";")
                 h = hedge_equalize(
                     my_side=my_side,
                     my_line=my_line,
@@ -365,7 +923,7 @@ def main():
                     hedge_line=hedge_line,
                     hedge_odds_american=hedge_odds,
                     live_total=live,
-                    flags=flags_list,
+                    flag_mask=r.flag_mask,
                 )
                 print("\n--- HEDGE OUTPUT ---")
                 print(f"Suggestion: {h.suggestion}")